@@ -1,11 +1,12 @@
 import asyncio
 import os
+import time
 import base64
-import traceback
 from importlib import import_module
+from importlib.resources import files
 import re
+from typing import Any
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.util.json import load_json
 
 try:
     from homeassistant.helpers.json import save_json
@@ -46,7 +47,7 @@ from .const import (
     CONF_MODEL_NUMBER,
     CONF_SERVERS, STORAGE_PATH, CONF_MANUFACTURER_CODE,
     CONF_SELECTED_HOMES, CONF_SMART_PRODUCT_ID, STORAGE_PLUGIN_PATH,
-    CONF_PASSWORD, CONF_SERVER
+    CONF_PASSWORD, CONF_SERVER, LUA_LIBRARIES
 )
 
 PLATFORMS: list[Platform] = [
@@ -68,30 +69,189 @@ async def import_module_async(module_name):
     # 在线程池中执行导入操作
     return await asyncio.to_thread(import_module, module_name, __package__)
 
-def get_sn8_used(hass: HomeAssistant, sn8):
-    entries = hass.config_entries.async_entries(DOMAIN)
-    count = 0
-    for entry in entries:
-        if sn8 == entry.data.get("sn8"):
-            count += 1
-    return count
-
+# 已导入的映射模块及其 sn8 查找表，按设备类型缓存
+_MAPPING_CACHE: dict[int, Any] = {}
+_SN8_LOOKUP: dict[int, tuple[dict[str, dict], list[tuple[frozenset, dict]], list[tuple[re.Pattern, dict]]]] = {}
+
+def _build_sn8_lookup(device_mapping: dict):
+    # support tuple & regular expression pattern to support multiple sn8 sharing one mapping
+    exact = {}
+    tuples = []
+    patterns = []
+    for key, config in device_mapping.items():
+        if isinstance(key, tuple):
+            tuples.append((frozenset(key), config))
+        elif isinstance(key, str):
+            exact[key] = config
+            # "default" 仅作为兜底映射，不参与正则匹配
+            if key != "default":
+                patterns.append((re.compile(key), config))
+    return exact, tuples, patterns
+
+# 家庭列表缓存有效期（秒），同一账号下的多个配置条目共享
+HOMES_CACHE_TTL = 300
+
+async def _get_cloud_homes(hass: HomeAssistant, session_key, cloud):
+    homes_cache = hass.data[DOMAIN].setdefault("cloud_homes", {})
+    cached = homes_cache.get(session_key)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+    homes = await cloud.list_home()
+    if homes:
+        homes_cache[session_key] = (homes, time.monotonic() + HOMES_CACHE_TTL)
+    return homes
+
+def _invalidate_cloud(hass: HomeAssistant, session_key):
+    # 清理失效的云会话及家庭列表缓存，下次设置时重新登录
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.get("cloud_sessions", {}).pop(session_key, None)
+    domain_data.get("cloud_homes", {}).pop(session_key, None)
+
+def _get_login_lock(hass: HomeAssistant, session_key) -> asyncio.Lock:
+    # 锁按 (事件循环, 会话) 区分，避免重载或测试时跨事件循环复用同一把锁
+    locks = hass.data[DOMAIN].setdefault("cloud_login_locks", {})
+    loop_id = id(asyncio.get_running_loop())
+    key = (loop_id, session_key)
+    if key not in locks:
+        # 清理其他事件循环遗留的锁
+        for stale_key in [k for k in locks if k[0] != loop_id]:
+            locks.pop(stale_key, None)
+        locks[key] = asyncio.Lock()
+    return locks[key]
+
+# 按 (设备类型, sn8) 缓存映射中提取出的默认值与预置属性键
+_DEVICE_PRESETS_CACHE: dict[tuple[int, str], tuple[dict, frozenset]] = {}
+
+# 实体 key 即属性名的平台
+_PRESET_PLATFORM_STRS = frozenset({
+    str(Platform.SENSOR),
+    str(Platform.BINARY_SENSOR),
+    str(Platform.SWITCH),
+    str(Platform.FAN),
+    str(Platform.SELECT),
+    str(Platform.VACUUM),
+})
+
+def _compute_device_presets(mapping: dict) -> tuple[dict, frozenset]:
+    # 映射配置均为字面量 dict/list/str，使用 type() 精确判断即可
+    default_values = {}
+    # 预置 attributes：包含 centralized 里声明的所有键、entities 中使用到的所有属性键
+    preset_keys = set(mapping.get("centralized", []))
+    entities_cfg = (mapping.get("entities") or {})
+    for platform_name, platform_cfg in entities_cfg.items():
+        if type(platform_cfg) is not dict:
+            continue
+        for entity_key, ecfg in platform_cfg.items():
+            if type(ecfg) is not dict:
+                continue
+            # 检查是否有 default_value 字段
+            if "default_value" in ecfg:
+                # 使用 entity_key 作为属性名，或者使用 attribute 字段
+                attr_name = ecfg.get("attribute", entity_key)
+                default_values[attr_name] = ecfg["default_value"]
+            # 常见直接属性字段
+            for k in [
+                "power",
+                "aux_heat",
+                "current_temperature",
+                "target_temperature",
+                "oscillate",
+                "min_temp",
+                "max_temp",
+            ]:
+                v = ecfg.get(k)
+                if type(v) is str:
+                    preset_keys.add(v)
+                elif type(v) is list:
+                    for vv in v:
+                        if type(vv) is str:
+                            preset_keys.add(vv)
+            # 模式映射里的条件字段
+            for map_key in [
+                "hvac_modes",
+                "preset_modes",
+                "swing_modes",
+                "fan_modes",
+                "operation_list",
+                "options",
+            ]:
+                maps = ecfg.get(map_key) or {}
+                if type(maps) is dict:
+                    for cond in maps.values():
+                        if type(cond) is dict:
+                            preset_keys.update(cond.keys())
+        # 传感器/开关等实体 key 本身也加入（其 key 即属性名）
+        if str(platform_name) in _PRESET_PLATFORM_STRS:
+            preset_keys.update(platform_cfg.keys())
+    return default_values, frozenset(preset_keys)
+
+def _apply_mapping(device: MiedaDevice, mapping: dict):
+    device.set_queries(mapping.get("queries", [{}]))
+    device.set_centralized(mapping.get("centralized", []))
+    try:
+        device.set_calculate(mapping.get("calculate") or {})
+    except Exception as e:
+        MideaLogger.warning(f"Invalid calculate config for {device.device_name}: {e}")
 
-def remove_device_config(hass: HomeAssistant, sn8):
-    config_file = hass.config.path(f"{CONFIG_PATH}/{sn8}.json")
+    # 提取默认值与需预置的属性键，相同型号的设备共用计算结果
+    try:
+        cache_key = (device.device_type, device.sn8)
+        presets = _DEVICE_PRESETS_CACHE.get(cache_key)
+        if presets is None:
+            presets = _compute_device_presets(mapping)
+            _DEVICE_PRESETS_CACHE[cache_key] = presets
+        default_values, preset_keys = presets
+        device.set_default_values(default_values)
+        # 写入默认空值
+        for k in preset_keys:
+            if k not in device.attributes:
+                device.attributes[k] = None
+    except Exception:
+        MideaLogger.warning("Apply default values failed for %s", device.device_name, exc_info=True)
+
+def _acquire_sn8(hass: HomeAssistant, sn8):
+    # 维护 sn8 引用计数，卸载时无需遍历所有配置条目
+    refcount = hass.data[DOMAIN].setdefault("sn8_refcount", {})
+    refcount[sn8] = refcount.get(sn8, 0) + 1
+
+def _release_sn8(hass: HomeAssistant, sn8):
+    refcount = hass.data.setdefault(DOMAIN, {}).setdefault("sn8_refcount", {})
+    count = refcount.get(sn8, 0)
+    if count <= 1:
+        refcount.pop(sn8, None)
+    else:
+        refcount[sn8] = count - 1
+
+def _sn8_in_use(hass: HomeAssistant, sn8) -> bool:
+    return hass.data.get(DOMAIN, {}).get("sn8_refcount", {}).get(sn8, 0) > 0
+
+
+def _storage_path(hass: HomeAssistant, relative_path: str) -> str:
+    # 存储目录在运行期间不变，缓存 hass.config.path 的结果
+    paths = hass.data.setdefault(DOMAIN, {}).setdefault("storage_paths", {})
+    path = paths.get(relative_path)
+    if path is None:
+        path = paths[relative_path] = hass.config.path(relative_path)
+    return path
+
+def _sync_remove_device_config(config_file: str):
     try:
         os.remove(config_file)
     except FileNotFoundError:
         pass
 
-async def load_device_config(hass: HomeAssistant, device_type, sn8):
-    def _ensure_dir_and_load(path_dir: str, path_file: str):
-        os.makedirs(path_dir, exist_ok=True)
-        return load_json(path_file, default={})
+async def remove_device_config(hass: HomeAssistant, sn8):
+    # 路径在事件循环中解析，执行器线程只做文件删除
+    config_file = os.path.join(_storage_path(hass, CONFIG_PATH), f"{sn8}.json")
+    await hass.async_add_executor_job(_sync_remove_device_config, config_file)
+
+def _sync_save_device_config(config_dir: str, config_file: str, save_data: dict):
+    os.makedirs(config_dir, exist_ok=True)
+    save_json(config_file, save_data)
 
-    config_dir = hass.config.path(CONFIG_PATH)
-    config_file = hass.config.path(f"{CONFIG_PATH}/{sn8}.json")
-    raw = await hass.async_add_executor_job(_ensure_dir_and_load, config_dir, config_file)
+async def load_device_config(hass: HomeAssistant, device_type, sn8):
+    config_dir = _storage_path(hass, CONFIG_PATH)
+    config_file = os.path.join(config_dir, f"{sn8}.json")
     json_data = {}
     # if isinstance(raw, dict) and len(raw) > 0:
     #     # 兼容两种文件结构：
@@ -104,14 +264,23 @@ async def load_device_config(hass: HomeAssistant, device_type, sn8):
     #         if any(k in raw for k in ["entities", "centralized", "queries", "manufacturer"]):
     #             json_data = raw
     # if not json_data:
-    device_path = f".device_mapping.{'T0x%02X' % device_type}"
     try:
-        mapping_module = await import_module_async(device_path)
-        for key, config in mapping_module.DEVICE_MAPPING.items():
-            # support tuple & regular expression pattern to support multiple sn8 sharing one mapping
-            if (key == sn8) or (isinstance(key, tuple) and sn8 in key) or (isinstance(key, str) and re.match(key, sn8)):
-                json_data = config
-                break
+        mapping_module = _MAPPING_CACHE.get(device_type)
+        if mapping_module is None:
+            device_path = f".device_mapping.{'T0x%02X' % device_type}"
+            mapping_module = await import_module_async(device_path)
+            _MAPPING_CACHE[device_type] = mapping_module
+        sn8_lookup = _SN8_LOOKUP.get(device_type)
+        if sn8_lookup is None:
+            sn8_lookup = _build_sn8_lookup(mapping_module.DEVICE_MAPPING)
+            _SN8_LOOKUP[device_type] = sn8_lookup
+        exact, tuples, patterns = sn8_lookup
+        json_data = exact.get(sn8)
+        if not json_data:
+            json_data = next((c for keys, c in tuples if sn8 in keys), None)
+        if not json_data and sn8 is not None:
+            json_data = next((c for p, c in patterns if p.match(sn8)), None)
+        json_data = json_data or {}
         if not json_data:
             if "default" in mapping_module.DEVICE_MAPPING:
                 json_data = mapping_module.DEVICE_MAPPING["default"]
@@ -120,11 +289,40 @@ async def load_device_config(hass: HomeAssistant, device_type, sn8):
     except ModuleNotFoundError:
         MideaLogger.warning(f"Can't load mapping file for type {'T0x%02X' % device_type}")
 
-    save_data = {sn8: json_data}
-    # offload save_json as well
-    await hass.async_add_executor_job(save_json, config_file, save_data)
+    # 空映射无需落盘
+    if json_data:
+        save_data = {sn8: json_data}
+        # 目录创建与写入合并为一次线程池调用
+        await hass.async_add_executor_job(_sync_save_device_config, config_dir, config_file, save_data)
     return json_data
 
+def _ensure_dirs(paths: list[str]):
+    for path in paths:
+        os.makedirs(path, exist_ok=True)
+
+def _sync_write_lua_files(lua_path: str, file_names):
+    os.makedirs(lua_path, exist_ok=True)
+    for file_name in file_names:
+        file_path = os.path.join(lua_path, file_name)
+        # 只有文件不存在时才创建
+        if os.path.exists(file_path):
+            continue
+        # 内置库仅在缺失时从包内读取，避免常驻内存
+        content = base64.b64decode(files(__package__).joinpath(f"{file_name}.b64").read_bytes())
+        try:
+            with open(file_path, "wb") as fp:
+                fp.write(content)
+        except PermissionError as e:
+            MideaLogger.error(f"Failed to create {file_name} at {file_path}: {e}")
+            # 如果无法创建文件，尝试使用临时目录
+            import tempfile
+            temp_dir = tempfile.gettempdir()
+            file_path = os.path.join(temp_dir, file_name)
+            with open(file_path, "wb") as fp:
+                fp.write(content)
+            MideaLogger.warning(f"Using temporary file for {file_name}: {file_path}")
+        del content
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     device_id = config_entry.data.get(CONF_DEVICE_ID)
     if device_id is not None:
@@ -141,52 +339,34 @@ async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
             if refresh_interval is not None:
                 device.set_refresh_interval(refresh_interval)
 
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry):
+    if config_entry.version > 1:
+        # 不支持从更高版本降级
+        return False
+    if config_entry.minor_version < 2:
+        # 1.1 -> 1.2：为旧的账号条目补充 unique_id，便于按索引查找
+        unique_id = config_entry.unique_id
+        selected_homes = config_entry.data.get(CONF_SELECTED_HOMES) or []
+        if unique_id is None and config_entry.data.get(CONF_TYPE) == CONF_ACCOUNT and selected_homes:
+            candidate = f"{config_entry.data.get(CONF_ACCOUNT)}_{selected_homes[0]}"
+            if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, candidate) is None:
+                unique_id = candidate
+        hass.config_entries.async_update_entry(config_entry, unique_id=unique_id, minor_version=2)
+    return True
+
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     hass.data.setdefault(DOMAIN, {})
-    os.makedirs(hass.config.path(STORAGE_PATH), exist_ok=True)
-    lua_path = hass.config.path(STORAGE_PATH)
-
-    cjson = os.path.join(lua_path, "cjson.lua")
-    bit = os.path.join(lua_path, "bit.lua")
-
-    # 只有文件不存在时才创建
-    if not os.path.exists(cjson):
-        from .const import CJSON_LUA
-        cjson_lua = base64.b64decode(CJSON_LUA.encode("utf-8")).decode("utf-8")
-        try:
-            with open(cjson, "wt", encoding="utf-8") as fp:
-                fp.write(cjson_lua)
-        except PermissionError as e:
-            MideaLogger.error(f"Failed to create cjson.lua at {cjson}: {e}")
-            # 如果无法创建文件，尝试使用临时目录
-            import tempfile
-            temp_dir = tempfile.gettempdir()
-            cjson = os.path.join(temp_dir, "cjson.lua")
-            with open(cjson, "wt", encoding="utf-8") as fp:
-                fp.write(cjson_lua)
-            MideaLogger.warning(f"Using temporary file for cjson.lua: {cjson}")
-
-    if not os.path.exists(bit):
-        from .const import BIT_LUA
-        bit_lua = base64.b64decode(BIT_LUA.encode("utf-8")).decode("utf-8")
-        try:
-            with open(bit, "wt", encoding="utf-8") as fp:
-                fp.write(bit_lua)
-        except PermissionError as e:
-            MideaLogger.error(f"Failed to create bit.lua at {bit}: {e}")
-            # 如果无法创建文件，尝试使用临时目录
-            import tempfile
-            temp_dir = tempfile.gettempdir()
-            bit = os.path.join(temp_dir, "bit.lua")
-            with open(bit, "wt", encoding="utf-8") as fp:
-                fp.write(bit_lua)
-            MideaLogger.warning(f"Using temporary file for bit.lua: {bit}")
-
+    # 目录创建与 Lua 库文件写入合并为一次线程池调用，避免阻塞事件循环
+    await hass.async_add_executor_job(
+        _sync_write_lua_files,
+        _storage_path(hass, STORAGE_PATH),
+        LUA_LIBRARIES,
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     device_type = config_entry.data.get(CONF_TYPE)
-    MideaLogger.debug(f"async_setup_entry type={device_type} data={config_entry.data}")
+    MideaLogger.debug("async_setup_entry type=%s data=%s", device_type, config_entry.data)
     if device_type == CONF_ACCOUNT:
         account = config_entry.data.get(CONF_ACCOUNT)
         password = config_entry.data.get(CONF_PASSWORD)
@@ -196,35 +376,35 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         hass.data.setdefault(DOMAIN, {})
         hass.data[DOMAIN].setdefault("cloud_sessions", {})
         hass.data[DOMAIN].setdefault("accounts", {})
-        hass.data[DOMAIN].setdefault("cloud_login_locks", {})
 
         # 使用账号和服务器作为会话唯一标识
         session_key = f"{account}_{server}"
 
-        # 确保同一账号的登录操作串行执行，避免并发登录冲突
-        if session_key not in hass.data[DOMAIN]["cloud_login_locks"]:
-            hass.data[DOMAIN]["cloud_login_locks"][session_key] = asyncio.Lock()
-
-        async with hass.data[DOMAIN]["cloud_login_locks"][session_key]:
-            cloud = hass.data[DOMAIN]["cloud_sessions"].get(session_key)
-
-            if not cloud:
-                cloud = get_midea_cloud(
-                    cloud_name=CONF_SERVERS.get(server),
-                    session=async_get_clientsession(hass),
-                    account=account,
-                    password=password,
-                )
-                if not cloud or not await cloud.login():
-                    MideaLogger.error("Midea cloud login failed")
-                    return False
-                # 缓存云会话，供其他配置条目复用
-                hass.data[DOMAIN]["cloud_sessions"][session_key] = cloud
-            elif not cloud._access_token:
-                # 会话已存在但未登录，重新登录
-                if not await cloud.login():
-                    MideaLogger.error("Midea cloud login failed")
-                    return False
+        cloud = hass.data[DOMAIN]["cloud_sessions"].get(session_key)
+        # 已登录的会话直接复用，无需等待登录锁
+        if not cloud or not cloud._access_token:
+            # 确保同一账号的登录操作串行执行，避免并发登录冲突
+            async with _get_login_lock(hass, session_key):
+                # 等待锁期间其他条目可能已完成登录，再次检查
+                cloud = hass.data[DOMAIN]["cloud_sessions"].get(session_key)
+
+                if not cloud:
+                    cloud = get_midea_cloud(
+                        cloud_name=CONF_SERVERS.get(server),
+                        session=async_get_clientsession(hass),
+                        account=account,
+                        password=password,
+                    )
+                    if not cloud or not await cloud.login():
+                        MideaLogger.error("Midea cloud login failed")
+                        return False
+                    # 缓存云会话，供其他配置条目复用
+                    hass.data[DOMAIN]["cloud_sessions"][session_key] = cloud
+                elif not cloud._access_token:
+                    # 会话已存在但未登录，重新登录
+                    if not await cloud.login():
+                        MideaLogger.error("Midea cloud login failed")
+                        return False
 
         # 获取配置中选中的所有家庭（用于自动创建其他家庭的配置条目）
         all_selected_homes = config_entry.data.get("all_selected_homes", [])
@@ -237,52 +417,55 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         if all_selected_homes and current_home_id:
             other_homes = [h for h in all_selected_homes if str(h) != str(current_home_id)]
             home_names = config_entry.data.get("home_names", {})
+            # 各家庭条目共用的账号信息
+            base_data = {
+                CONF_TYPE: CONF_ACCOUNT,
+                CONF_ACCOUNT: account,
+                CONF_PASSWORD: password,
+                CONF_SERVER: server,
+                "nickname": cloud.nickname,
+            }
+            # 未设置 unique_id 的旧配置条目只能按数据中的家庭判断
+            legacy_homes = {
+                str(entry_homes[0])
+                for entry in hass.config_entries.async_entries(DOMAIN)
+                if entry.unique_id is None and (entry_homes := entry.data.get(CONF_SELECTED_HOMES, []))
+            }
 
             for home_id in other_homes:
                 home_id_str = str(home_id)
                 home_name = home_names.get(home_id_str, f"家庭 {home_id}")
                 # 检查该家庭是否已有配置条目
-                existing_entries = hass.config_entries.async_entries(DOMAIN)
-                home_exists = False
-                for entry in existing_entries:
-                    entry_homes = entry.data.get(CONF_SELECTED_HOMES, [])
-                    if entry_homes and str(entry_homes[0]) == home_id_str:
-                        home_exists = True
-                        break
-
-                if not home_exists:
-                    # 获取该家庭的设备数量
-                    appliances = await cloud.list_appliances(home_id)
-                    device_count = len(appliances or [])
-                    # 异步创建该家庭的配置条目
+                if (
+                    hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, f"{account}_{home_id}") is None
+                    and home_id_str not in legacy_homes
+                ):
+                    # 异步创建该家庭的配置条目，各家庭互不等待
                     hass.async_create_task(
                         hass.config_entries.flow.async_init(
                             DOMAIN,
                             context={"source": "home"},
                             data={
-                                CONF_TYPE: CONF_ACCOUNT,
-                                CONF_ACCOUNT: account,
-                                CONF_PASSWORD: password,
-                                CONF_SERVER: server,
+                                **base_data,
                                 CONF_SELECTED_HOMES: [home_id],
                                 "home_name": home_name,
                                 "home_id": home_id,
-                                "nickname": cloud.nickname,
-                                "device_count": device_count,
                             },
                         )
                     )
 
         # 拉取家庭与设备列表
         try:
-            homes = await cloud.list_home()
+            homes = await _get_cloud_homes(hass, session_key, cloud)
+            if not homes:
+                _invalidate_cloud(hass, session_key)
             if homes:
                 bucket = {"device_list": {}, "coordinator_map": {}}
                 
                 # 获取用户选择的家庭ID列表
                 selected_homes = config_entry.data.get(CONF_SELECTED_HOMES, [])
-                MideaLogger.debug(f"Selected homes from config: {selected_homes}")
-                MideaLogger.debug(f"Available homes keys: {list(homes.keys())}")
+                MideaLogger.debug("Selected homes from config: %s", selected_homes)
+                MideaLogger.debug("Available homes keys: %s", list(homes))
                 if not selected_homes:
                     # 如果没有选择，默认使用所有家庭
                     home_ids = list(homes.keys())
@@ -294,7 +477,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                             if key is not None and key in homes and key not in home_ids:
                                 home_ids.append(key)
                                 break
-                MideaLogger.debug(f"Final home_ids to process: {home_ids}")
+                MideaLogger.debug("Final home_ids to process: %s", home_ids)
 
                 # 同步云端家庭名称到本地配置
                 if home_ids:
@@ -314,34 +497,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                             )
                             MideaLogger.info(f"Updated home name from '{current_home_name}' to '{new_home_name}'")
 
-                for home_id in home_ids:
-                    appliances = await cloud.list_appliances(home_id)
-                    if appliances is None:
-                        continue
-
-                    # 为每台设备构建占位设备与协调器（不连接本地）
-                    for appliance_code, info in appliances.items():
-                        MideaLogger.debug(f"info={info} ")
-
-                        os.makedirs(hass.config.path(STORAGE_PATH), exist_ok=True)
-                        path = hass.config.path(STORAGE_PATH)
-                        file = None
-
-                        try:
-                            file = await cloud.download_lua(
-                                path=path,
+                # 资源目录只需创建一次，在线程池中完成
+                lua_path = _storage_path(hass, STORAGE_PATH)
+                plugin_path = _storage_path(hass, STORAGE_PLUGIN_PATH)
+                await hass.async_add_executor_job(_ensure_dirs, [lua_path, plugin_path])
+
+                # 限制并发下载数量，避免同时向云端发起过多请求
+                download_semaphore = asyncio.Semaphore(8)
+
+                async def _finish_appliance_setup(appliance_code, info, device, coordinator):
+                    # 后台下载 Lua / Plugin 资源，完成后再加载 Lua 并刷新设备状态
+                    async with download_semaphore:
+                        # 两类资源互不依赖，并发下载
+                        file, plugin_result = await asyncio.gather(
+                            cloud.download_lua(
+                                path=lua_path,
                                 device_type=info.get(CONF_TYPE),
                                 sn=info.get(CONF_SN),
                                 model_number=info.get(CONF_MODEL_NUMBER),
                                 manufacturer_code=info.get(CONF_MANUFACTURER_CODE),
-                            )
-                        except Exception as e:
-                            MideaLogger.warning(f"Failed to download lua for {info.get(CONF_NAME)}: {e}")
-
-                        try:
-                            os.makedirs(hass.config.path(STORAGE_PLUGIN_PATH), exist_ok=True)
-                            plugin_path = hass.config.path(STORAGE_PLUGIN_PATH)
-                            await cloud.download_plugin(
+                            ),
+                            cloud.download_plugin(
                                 path=plugin_path,
                                 appliance_code=appliance_code,
                                 smart_product_id=info.get(CONF_SMART_PRODUCT_ID),
@@ -350,147 +526,103 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                                 sn8=info.get(CONF_SN8),
                                 model_number=info.get(CONF_MODEL_NUMBER),
                                 manufacturer_code=info.get(CONF_MANUFACTURER_CODE),
-                            )
-                        except Exception as e:
-                            MideaLogger.warning(f"Failed to download plugin for {info.get(CONF_NAME)}: {e}")
+                            ),
+                            return_exceptions=True,
+                        )
+                    if isinstance(file, Exception):
+                        MideaLogger.warning(f"Failed to download lua for {info.get(CONF_NAME)}: {file}")
+                        file = None
+                    if isinstance(plugin_result, Exception):
+                        MideaLogger.warning(f"Failed to download plugin for {info.get(CONF_NAME)}: {plugin_result}")
 
+                    if file is not None:
                         try:
-                            device = MiedaDevice(
-                                name=info.get(CONF_NAME),
-                                device_id=appliance_code,
-                                device_type=info.get(CONF_TYPE),
-                                ip_address=None,
-                                port=None,
-                                token=None,
-                                key=None,
-                                connected=info.get("online"),
-                                protocol=info.get(CONF_PROTOCOL) or 2,
-                                model=info.get(CONF_MODEL),
-                                subtype=info.get(CONF_MODEL_NUMBER),
-                                manufacturer_code=info.get(CONF_MANUFACTURER_CODE),
-                                sn=info.get(CONF_SN),
-                                sn8=info.get(CONF_SN8),
-                                lua_file=file,
-                                cloud=cloud,
-                            )
-                            # 加载并应用设备映射（queries/centralized/calculate），并预置 attributes 键
-                            try:
-                                mapping = await load_device_config(
-                                    hass,
-                                    info.get(CONF_TYPE) or info.get("type"),
-                                    info.get(CONF_SN8) or info.get("sn8"),
-                                ) or {}
-                            except Exception:
-                                mapping = {}
-
-                            try:
-                                device.set_queries(mapping.get("queries", [{}]))
-                            except Exception:
-                                pass
-                            try:
-                                device.set_centralized(mapping.get("centralized", []))
-                            except Exception:
-                                pass
-                            try:
-                                device.set_calculate(mapping.get("calculate", {}))
-                            except Exception:
-                                pass
-
-                            # 提取并设置默认值
-                            try:
-                                default_values = {}
-                                entities_cfg = (mapping.get("entities") or {})
-                                for platform_cfg in entities_cfg.values():
-                                    if not isinstance(platform_cfg, dict):
-                                        continue
-                                    for entity_key, ecfg in platform_cfg.items():
-                                        if not isinstance(ecfg, dict):
-                                            continue
-                                        # 检查是否有 default_value 字段
-                                        if "default_value" in ecfg:
-                                            # 使用 entity_key 作为属性名，或者使用 attribute 字段
-                                            attr_name = ecfg.get("attribute", entity_key)
-                                            default_values[attr_name] = ecfg["default_value"]
-                                device.set_default_values(default_values)
-                            except Exception:
-                                traceback.print_exc()
-
-                            # 预置 attributes：包含 centralized 里声明的所有键、entities 中使用到的所有属性键
-                            try:
-                                preset_keys = set(mapping.get("centralized", []))
-                                entities_cfg = (mapping.get("entities") or {})
-                                # 收集实体配置中直接引用的属性键
-                                for platform_cfg in entities_cfg.values():
-                                    if not isinstance(platform_cfg, dict):
-                                        continue
-                                    for _, ecfg in platform_cfg.items():
-                                        if not isinstance(ecfg, dict):
-                                            continue
-                                        # 常见直接属性字段
-                                        for k in [
-                                            "power",
-                                            "aux_heat",
-                                            "current_temperature",
-                                            "target_temperature",
-                                            "oscillate",
-                                            "min_temp",
-                                            "max_temp",
-                                        ]:
-                                            v = ecfg.get(k)
-                                            if isinstance(v, str):
-                                                preset_keys.add(v)
-                                            elif isinstance(v, list):
-                                                for vv in v:
-                                                    if isinstance(vv, str):
-                                                        preset_keys.add(vv)
-                                        # 模式映射里的条件字段
-                                        for map_key in [
-                                            "hvac_modes",
-                                            "preset_modes",
-                                            "swing_modes",
-                                            "fan_modes",
-                                            "operation_list",
-                                            "options",
-                                        ]:
-                                            maps = ecfg.get(map_key) or {}
-                                            if isinstance(maps, dict):
-                                                for _, cond in maps.items():
-                                                    if isinstance(cond, dict):
-                                                        for attr_name in cond.keys():
-                                                            preset_keys.add(attr_name)
-                                # 传感器/开关等实体 key 本身也加入（其 key 即属性名）
-                                for platform_name, platform_cfg in entities_cfg.items():
-                                    if not isinstance(platform_cfg, dict):
-                                        continue
-                                    platform_str = str(platform_name)
-                                    if platform_str in [
-                                        str(Platform.SENSOR),
-                                        str(Platform.BINARY_SENSOR),
-                                        str(Platform.SWITCH),
-                                        str(Platform.FAN),
-                                        str(Platform.SELECT),
-                                        str(Platform.VACUUM),
-                                    ]:
-                                        for entity_key in platform_cfg.keys():
-                                            preset_keys.add(entity_key)
-                                # 写入默认空值
-                                for k in preset_keys:
-                                    if k not in device.attributes:
-                                        device.attributes[k] = None
-                                # 针对T0xD9复式洗衣机，设置默认的筒选择为左筒
-                                if device.device_type == 0xD9:
-                                    device.attributes["db_location_selection"] = "left"
-                            except Exception:
-                                pass
-
-                            coordinator = MideaDataUpdateCoordinator(hass, config_entry, device, cloud=cloud)
-                            # 后台刷新，避免初始化阻塞
-                            hass.async_create_task(coordinator.async_config_entry_first_refresh())
-                            bucket["device_list"][appliance_code] = info
-                            bucket["coordinator_map"][appliance_code] = coordinator
+                            device.set_lua_file(file)
                         except Exception as e:
-                            MideaLogger.error(f"Init device failed: {appliance_code}, error: {e}")
-                    # break
+                            MideaLogger.warning(f"Failed to load lua for {info.get(CONF_NAME)}: {e}")
+                    await coordinator.async_request_refresh()
+
+                async def _setup_appliance(appliance_code, info):
+                    MideaLogger.debug("info=%s ", info)
+
+                    try:
+                        device = MiedaDevice(
+                            name=info.get(CONF_NAME),
+                            device_id=appliance_code,
+                            device_type=info.get(CONF_TYPE),
+                            ip_address=None,
+                            port=None,
+                            token=None,
+                            key=None,
+                            connected=info.get("online"),
+                            protocol=info.get(CONF_PROTOCOL) or 2,
+                            model=info.get(CONF_MODEL),
+                            subtype=info.get(CONF_MODEL_NUMBER),
+                            manufacturer_code=info.get(CONF_MANUFACTURER_CODE),
+                            sn=info.get(CONF_SN),
+                            sn8=info.get(CONF_SN8),
+                            lua_file=None,
+                            cloud=cloud,
+                        )
+                        # 加载并应用设备映射（queries/centralized/calculate），并预置 attributes 键
+                        try:
+                            mapping = await load_device_config(
+                                hass,
+                                info.get(CONF_TYPE) or info.get("type"),
+                                info.get(CONF_SN8) or info.get("sn8"),
+                            ) or {}
+                        except Exception:
+                            mapping = {}
+
+                        # 未找到映射的设备保持默认配置，无需处理
+                        if mapping:
+                            _apply_mapping(device, mapping)
+                        # 针对T0xD9复式洗衣机，设置默认的筒选择为左筒
+                        if device.device_type == 0xD9:
+                            device.attributes["db_location_selection"] = "left"
+
+                        coordinator = MideaDataUpdateCoordinator(hass, config_entry, device, cloud=cloud)
+                        # 后台刷新，避免初始化阻塞；任务归属于配置条目，卸载时随之取消
+                        config_entry.async_create_background_task(
+                            hass,
+                            coordinator.async_config_entry_first_refresh(),
+                            name=f"midea_first_refresh_{appliance_code}",
+                        )
+                        bucket["device_list"][appliance_code] = info
+                        bucket["coordinator_map"][appliance_code] = coordinator
+                        _acquire_sn8(hass, device.sn8)
+                        # 资源下载放到后台执行，不阻塞集成启动
+                        config_entry.async_create_background_task(
+                            hass,
+                            _finish_appliance_setup(appliance_code, info, device, coordinator),
+                            name=f"midea_setup_{appliance_code}",
+                        )
+                    except Exception as e:
+                        MideaLogger.error(f"Init device failed: {appliance_code}, error: {e}")
+
+                # 并发拉取各家庭的设备列表
+                home_results = await asyncio.gather(
+                    *[cloud.list_appliances(home_id) for home_id in home_ids],
+                    return_exceptions=True,
+                )
+                if home_results and all(r is None or isinstance(r, Exception) for r in home_results):
+                    # 所有家庭的设备列表均拉取失败，通常是登录态失效
+                    _invalidate_cloud(hass, session_key)
+                tasks = []
+                for home_id, appliances in zip(home_ids, home_results):
+                    if isinstance(appliances, Exception):
+                        MideaLogger.warning(f"Failed to list appliances for home {home_id}: {appliances}")
+                        continue
+                    if appliances is None:
+                        continue
+                    # 为每台设备构建占位设备与协调器（不连接本地）
+                    for appliance_code, info in appliances.items():
+                        tasks.append(_setup_appliance(appliance_code, info))
+                # 各设备互不依赖，并发初始化；单台失败不影响其他设备
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        MideaLogger.error(f"Init device failed: {result}")
                 hass.data[DOMAIN]["accounts"][config_entry.entry_id] = bucket
 
         except Exception as e:
@@ -506,17 +638,20 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
         if unload_ok:
             try:
-                hass.data.get(DOMAIN, {}).get("accounts", {}).pop(config_entry.entry_id, None)
-            except Exception:
-                pass
+                bucket = hass.data.get(DOMAIN, {}).get("accounts", {}).pop(config_entry.entry_id, None)
+                if bucket:
+                    # 释放 sn8 引用计数；映射缓存文件保留，重载时无需重新下载
+                    for coordinator in bucket.get("coordinator_map", {}).values():
+                        _release_sn8(hass, coordinator.device.sn8)
+            except Exception as e:
+                MideaLogger.warning(f"Cleanup account entry {config_entry.entry_id} failed: {e}")
         return unload_ok
     if device_id is not None:
         device: MiedaDevice = hass.data[DOMAIN][DEVICES][device_id][CONF_DEVICE]
         if device is not None:
-            if get_sn8_used(hass, device.sn8) == 1:
-                remove_device_config(hass, device.sn8)
+            # 单设备条目不计入引用计数，仅在没有账号条目的设备使用该 sn8 时删除
+            if not _sn8_in_use(hass, device.sn8):
+                await remove_device_config(hass, device.sn8)
             # device.close()
         hass.data[DOMAIN][DEVICES].pop(device_id)
-    for platform in PLATFORMS:
-        await hass.config_entries.async_forward_entry_unload(config_entry, platform)
-    return True
+    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -1,6 +1,8 @@
+import asyncio
 import voluptuous as vol
 import logging
 import os
+import time
 from typing import Any
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant import config_entries
@@ -24,16 +26,51 @@ from .const import (
     CONF_SMART_PRODUCT_ID,
     CONF_SN8,
 )
-from .core.cloud import get_midea_cloud
 
 _LOGGER = logging.getLogger(__name__)
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    _session = None
-    _cloud = None
-    _homes = None
-    _home_names = None
-    _appliances_info = None
+    # 1.2：账号条目使用 "账号_家庭ID" 作为 unique_id
+    VERSION = 1
+    MINOR_VERSION = 2
+
+    def __init__(self) -> None:
+        # 流程状态均为实例属性，避免在类上共享
+        self._session = None
+        self._cloud = None
+        self._user_input = None
+        self._nickname = None
+        self._session_key = None
+        self._creds_hash = None
+        # 云端列表查询结果缓存，key -> (过期时间, 结果)，仅在本次流程的步骤间复用
+        self._list_cache: dict[tuple, tuple[float, Any]] = {}
+        self._home_meta = None
+        self._selected = None
+        self._config_data = None
+        self._appliances_info = None
+        self._home_device_counts = {}
+        self._total_devices = 0
+        self._total_homes = 0
+        self._download_task = None
+        self._download_results = None
+        self._download_progress = 0
+        self._lua_path = None
+        self._plugin_path = None
+        self._appliances_list = []
+
+    async def _cached(self, key: tuple, ttl: float, coro_factory):
+        now = time.monotonic()
+        cached = self._list_cache.get(key)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        result = await coro_factory()
+        if result:
+            self._list_cache[key] = (now + ttl, result)
+        return result
+
+    def _evict_cached(self, session_key: str):
+        for key in [k for k in self._list_cache if k[1] == session_key]:
+            self._list_cache.pop(key, None)
 
     @staticmethod
     @callback
@@ -50,6 +87,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if self._session is None:
             self._session = async_create_clientsession(self.hass)
         if user_input is not None:
+            # 返回后以相同账号信息再次提交，直接复用已登录的云实例和家庭列表
+            creds_hash = hash((user_input[CONF_ACCOUNT], user_input[CONF_PASSWORD], user_input[CONF_SERVER]))
+            if self._cloud is not None and self._home_meta and self._creds_hash == creds_hash:
+                return await self.async_step_select_homes()
+
+            from .core.cloud import get_midea_cloud
+            session_key = f"{user_input[CONF_ACCOUNT]}_{user_input[CONF_SERVER]}"
             cloud = get_midea_cloud(
                 session=self._session,
                 cloud_name=CONF_SERVERS[user_input[CONF_SERVER]],
@@ -68,24 +112,28 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # 缓存云会话，供后续配置条目复用，避免重复登录
                     self.hass.data.setdefault(DOMAIN, {})
                     self.hass.data[DOMAIN].setdefault("cloud_sessions", {})
-                    session_key = f"{user_input[CONF_ACCOUNT]}_{user_input[CONF_SERVER]}"
                     self.hass.data[DOMAIN]["cloud_sessions"][session_key] = cloud
+                    self._session_key = session_key
 
                     # 获取家庭列表
-                    homes = await cloud.list_home()
+                    homes = await self._cached(("homes", session_key), 60, cloud.list_home)
                     if homes:
                         _LOGGER.debug(f"Found homes: {homes}")
-                        self._homes = homes
-                        self._home_names = {}
-                        for home_id, home_info in homes.items():
-                            self._home_names[home_id] = self._get_home_name(home_info, home_id)
+                        # 预先整理家庭信息（原始 ID、名称），后续步骤直接按字符串 ID 查询
+                        self._home_meta = {
+                            str(home_id): {"id": home_id, "name": self._get_home_name(home_info, home_id)}
+                            for home_id, home_info in homes.items()
+                        }
+                        self._creds_hash = creds_hash
                         return await self.async_step_select_homes()
                     else:
                         errors["base"] = "no_homes"
                 else:
+                    self._evict_cached(session_key)
                     errors["base"] = "login_failed"
             except Exception as e:
                 _LOGGER.exception("Login error: %s", e)
+                self._evict_cached(session_key)
                 errors["base"] = "login_failed"
         return self.async_show_form(
             step_id="user",
@@ -106,12 +154,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not selected_homes:
                 errors["base"] = "no_homes_selected"
             else:
-                selected_home_ids = []
-                for home_id in selected_homes:
-                    for key in [home_id, str(home_id), int(home_id) if str(home_id).isdigit() else None]:
-                        if key is not None and key in self._homes and key not in selected_home_ids:
-                            selected_home_ids.append(key)
-                            break
+                # 按提交顺序整理选中的家庭，字符串 ID -> 家庭信息
+                previous_selected = self._selected
+                self._selected = {
+                    home_id_str: self._home_meta[home_id_str]
+                    for home_id_str in dict.fromkeys(str(home_id) for home_id in selected_homes)
+                    if home_id_str in self._home_meta
+                }
+                selected_home_ids = [meta["id"] for meta in self._selected.values()]
 
                 if not selected_home_ids:
                     errors["base"] = "no_homes_selected"
@@ -123,15 +173,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         for home_id in entry_homes:
                             configured_homes.add(str(home_id))
                     
-                    for home_id in selected_home_ids:
-                        if str(home_id) in configured_homes:
-                            errors["base"] = "home_already_configured"
-                            break
+                    if not configured_homes.isdisjoint(self._selected):
+                        errors["base"] = "home_already_configured"
                     
                     if errors.get("base"):
-                        home_options = {}
-                        for home_id, home_info in self._homes.items():
-                            home_options[str(home_id)] = self._get_home_name(home_info, home_id)
+                        home_options = {home_id_str: meta["name"] for home_id_str, meta in self._home_meta.items()}
                         default_selected = list(home_options.keys())
                         return self.async_show_form(
                             step_id="select_homes",
@@ -143,17 +189,40 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             errors=errors,
                         )
                     
+                    # 返回上一步后未改变选择，直接复用已获取的设备列表和下载结果
+                    if (
+                        self._selected == previous_selected
+                        and self._appliances_info is not None
+                        and self._download_results is not None
+                    ):
+                        return await self.async_step_confirm()
+
                     first_home_id = selected_home_ids[0]
-                    first_home_name = self._home_names.get(first_home_id, f"家庭 {first_home_id}")
+                    first_home_name = self._selected[str(first_home_id)]["name"]
 
-                    total_devices = 0
                     appliances_info = {}
-                    for home_id in selected_home_ids:
-                        appliances = await self._cloud.list_appliances(home_id)
-                        if appliances:
-                            total_devices += len(appliances)
-                            for appliance_code, info in appliances.items():
-                                appliances_info[appliance_code] = info
+                    # 并发拉取各家庭的设备列表
+                    results = await asyncio.gather(
+                        *[
+                            self._cached(
+                                ("appliances", self._session_key, home_id),
+                                30,
+                                lambda home_id=home_id: self._cloud.list_appliances(home_id),
+                            )
+                            for home_id in selected_home_ids
+                        ],
+                        return_exceptions=True,
+                    )
+                    home_device_counts = {}
+                    for home_id, appliances in zip(selected_home_ids, results):
+                        if isinstance(appliances, Exception):
+                            _LOGGER.warning("Failed to list appliances for home %s: %s", home_id, appliances)
+                            continue
+                        if not appliances:
+                            continue
+                        home_device_counts[str(home_id)] = len(appliances)
+                        appliances_info.update(appliances)
+                    total_devices = len(appliances_info)
 
                     self._config_data = {
                         CONF_TYPE: CONF_ACCOUNT,
@@ -163,18 +232,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SELECTED_HOMES: [first_home_id],
                         "home_name": first_home_name,
                         "all_selected_homes": selected_home_ids,
-                        "home_names": {str(hid): self._home_names.get(hid, f"家庭 {hid}") for hid in selected_home_ids}
+                        "home_names": {home_id_str: meta["name"] for home_id_str, meta in self._selected.items()}
                     }
                     self._total_devices = total_devices
                     self._total_homes = len(selected_home_ids)
                     self._appliances_info = appliances_info
+                    self._home_device_counts = home_device_counts
                     return await self.async_step_download()
 
         # 构建家庭选择选项
-        home_options = {}
-        for home_id, home_info in self._homes.items():
-            _LOGGER.debug(f"Processing home_id: {home_id}, home_info: {home_info}, type: {type(home_info)}")
-            home_options[str(home_id)] = self._get_home_name(home_info, home_id)
+        home_options = {home_id_str: meta["name"] for home_id_str, meta in self._home_meta.items()}
 
         # 默认全选
         default_selected = list(home_options.keys())
@@ -196,7 +263,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if self._appliances_info is None or len(self._appliances_info) == 0:
             return await self.async_step_confirm()
 
-        if not hasattr(self, '_download_task') or self._download_task is None:
+        if self._download_task is None:
             self._download_progress = 0
             self._download_results = {"success": 0, "skipped": 0, "failed": 0}
             self._lua_path = self.hass.config.path(STORAGE_PATH)
@@ -267,34 +334,53 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_confirm(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         if user_input is not None:
             first_home_name = self._config_data.get("home_name", "")
-            nickname = getattr(self, "_nickname", self._config_data.get(CONF_ACCOUNT, ""))
+            nickname = self._nickname or self._config_data.get(CONF_ACCOUNT, "")
             title = f"{nickname} | {first_home_name}"
 
+            # 与自动创建的家庭条目一致，使用账号+家庭ID作为唯一标识
+            first_home_id = self._config_data[CONF_SELECTED_HOMES][0]
+            await self.async_set_unique_id(f"{self._config_data[CONF_ACCOUNT]}_{first_home_id}")
+            self._abort_if_unique_id_configured()
+
             return self.async_create_entry(
                 title=title,
                 data=self._config_data,
             )
 
-        download_results = getattr(self, "_download_results", None)
-        download_summary = ""
-        if download_results:
-            success = download_results['success']
-            skipped = download_results['skipped']
-            failed = download_results['failed']
-            if failed > 0:
-                download_summary = f"✅ 成功 {success} 个\n⏭️ 跳过 {skipped} 个\n❌ 失败 {failed} 个"
-            else:
-                download_summary = f"✅ 成功 {success} 个\n⏭️ 跳过 {skipped} 个"
+        # 文案模板在 translations 中，这里只提供数值和家庭列表
+        download_results = self._download_results or {}
+        home_device_counts = self._home_device_counts
+        homes_list = "\n".join(
+            f"- {meta['name']} ({home_device_counts.get(home_id_str, 0)})"
+            for home_id_str, meta in self._selected.items()
+        )
+
+        # 按下载结果选择描述模板：未下载、全部成功或存在失败
+        if self._download_results is None:
+            step_id = "confirm_none"
+        elif download_results.get("failed", 0):
+            step_id = "confirm_failed"
+        else:
+            step_id = "confirm"
 
         return self.async_show_form(
-            step_id="confirm",
+            step_id=step_id,
             description_placeholders={
                 "homes_count": str(self._total_homes),
                 "devices_count": str(self._total_devices),
-                "download_summary": download_summary,
+                "homes_list": homes_list,
+                "success_count": str(download_results.get("success", 0)),
+                "skipped_count": str(download_results.get("skipped", 0)),
+                "failed_count": str(download_results.get("failed", 0)),
             },
         )
 
+    async def async_step_confirm_failed(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        return await self.async_step_confirm(user_input)
+
+    async def async_step_confirm_none(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
+        return await self.async_step_confirm(user_input)
+
     async def async_step_home(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         # 用于自动创建其他家庭的配置条目（由 __init__.py 调用）
         if user_input is not None:
@@ -325,6 +411,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry):
         self._config_entry = config_entry
+        self._session = None
 
     async def async_step_init(self, user_input=None, error=None):
         """初始化选项流程"""
@@ -347,15 +434,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
         
         if user_input is not None:
-            # 验证新密码
-            cloud = get_midea_cloud(
-                session=async_create_clientsession(self.hass),
-                cloud_name=CONF_SERVERS[user_input[CONF_SERVER]],
-                account=user_input[CONF_ACCOUNT],
-                password=user_input[CONF_PASSWORD]
-            )
+            session_key = f"{user_input[CONF_ACCOUNT]}_{user_input[CONF_SERVER]}"
+            cloud_sessions = self.hass.data.setdefault(DOMAIN, {}).setdefault("cloud_sessions", {})
+            cloud = cloud_sessions.get(session_key)
             try:
-                if await cloud.login():
+                # 凭据未变且缓存的云会话仍处于登录状态时直接复用，无需重新登录
+                if cloud is not None and cloud.is_logged_in_as(user_input[CONF_ACCOUNT], user_input[CONF_PASSWORD]):
+                    logged_in = True
+                else:
+                    # 重复提交时复用同一个会话
+                    if self._session is None:
+                        self._session = async_create_clientsession(self.hass)
+                    # 验证新密码
+                    from .core.cloud import get_midea_cloud
+                    cloud = get_midea_cloud(
+                        session=self._session,
+                        cloud_name=CONF_SERVERS[user_input[CONF_SERVER]],
+                        account=user_input[CONF_ACCOUNT],
+                        password=user_input[CONF_PASSWORD]
+                    )
+                    logged_in = await cloud.login()
+                    if logged_in:
+                        cloud_sessions[session_key] = cloud
+                if logged_in:
                     current_data = dict(self._config_entry.data)
                     current_data[CONF_ACCOUNT] = user_input[CONF_ACCOUNT]
                     current_data[CONF_PASSWORD] = user_input[CONF_PASSWORD]
@@ -365,11 +466,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     account = user_input[CONF_ACCOUNT]
                     new_title = f"{account} | {home_name}" if home_name else account
 
-                    self.hass.config_entries.async_update_entry(
-                        self._config_entry,
-                        title=new_title,
-                        data=current_data
-                    )
+                    # 内容未变化时跳过更新，避免触发监听器与存储写入
+                    if self._config_entry.title != new_title or self._config_entry.data != current_data:
+                        self.hass.config_entries.async_update_entry(
+                            self._config_entry,
+                            title=new_title,
+                            data=current_data
+                        )
                     return self.async_create_entry(title="", data={})
                 else:
                     errors["base"] = "login_failed"
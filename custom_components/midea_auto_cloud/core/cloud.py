@@ -66,6 +66,10 @@ class MideaCloud:
     def _make_general_data(self):
         return {}
 
+    def is_logged_in_as(self, account: str, password: str) -> bool:
+        """是否已使用指定的账号密码登录"""
+        return self._access_token is not None and self._account == account and self._password == password
+
     async def _api_request(self, endpoint: str, data: dict, header=None, method="POST") -> dict | None:
         header = header or {}
         if not data.get("reqId"):
@@ -1,6 +1,7 @@
-import threading
+import re
+import sys
 import socket
-import traceback
+from functools import lru_cache, partial
 from enum import IntEnum
 
 from .cloud import MideaCloud, MSmartHomeCloud, MeijuCloud
@@ -30,7 +31,60 @@ class ParseMessageResult(IntEnum):
     ERROR = 99
 
 
-class MiedaDevice(threading.Thread):
+@lru_cache(maxsize=64)
+def _serialize_custom(device_type: int, cmd_type: int, cmd_body: bytes) -> bytes:
+    # 自定义命令的序列化结果只取决于输入，重复下发的相同命令直接复用
+    return bytes(MessageQuestCustom(device_type, cmd_type, bytearray(cmd_body)).serialize())
+
+
+# 设备类型字符串，如 0xD9 -> "T0xD9"
+_TYPE_STR = tuple(f"T0x{i:02X}" for i in range(256))
+
+# 区分"未传入"与 None 的哨兵
+_MISSING = object()
+
+# 已编译的计算规则，(lvalue, rvalue) -> calc(target, source)，同一映射的多个设备共用
+_CALC_CACHE: dict[tuple[str, str], object] = {}
+# 规则中引用的属性名，如 "[a] * 60 + [b]" 中的 a、b
+_CALC_REF_RE = re.compile(r"\[([^\]]+)\]")
+
+
+def _compile_calculation(lvalue: str, rvalue: str):
+    # 将 "[a] = [b] * 60 + [c]" 形式的规则编译为函数，t 为写入的字典，s 为读取的字典
+    key = (lvalue, rvalue)
+    if (calc := _CALC_CACHE.get(key)) is None:
+        target = lvalue.replace("[", "t[\"").replace("]", "\"]")
+        expr = rvalue.replace("[", "s[\"").replace("]", "\"]")
+        namespace = {}
+        exec(compile(f"def calc(t, s):\n    {target} = {expr}\n", f"<calculate {lvalue}>", "exec"), namespace)
+        calc = _CALC_CACHE[key] = namespace["calc"]
+    return calc
+
+
+def compile_calculations(rules: list | None) -> list[tuple[str, str, frozenset, object]]:
+    """将映射中的计算规则预编译为 (lvalue, rvalue, refs, calc) 列表"""
+    compiled = []
+    for c in rules or []:
+        lvalue = c.get("lvalue")
+        rvalue = c.get("rvalue")
+        if lvalue and rvalue:
+            try:
+                compiled.append((
+                    lvalue, rvalue, frozenset(_CALC_REF_RE.findall(rvalue)), _compile_calculation(lvalue, rvalue)
+                ))
+            except SyntaxError:
+                MideaLogger.warning(f"Invalid calculation: {lvalue} = {rvalue}")
+    return compiled
+
+
+class MiedaDevice:
+    # 接收缓冲区已消费部分超过该大小时才收缩
+    _BUFFER_RELAX = 16384
+    # T0xD9复式洗衣机筒位：db_location <-> db_location_selection，以及切换映射
+    _LOC_SEL = {1: "left", 2: "right"}
+    _LOC_FROM_SEL = {"left": 1, "right": 2}
+    _LOC_FLIP = {1: 2, 2: 1}
+
     def __init__(self,
                  name: str,
                  device_id: int,
@@ -48,14 +102,18 @@ class MiedaDevice(threading.Thread):
                  sn8: str | None,
                  lua_file: str | None,
                  cloud: MideaCloud | None):
-        threading.Thread.__init__(self)
         self._socket = None
         self._ip_address = ip_address
         self._port = port
         self._security = LocalSecurity()
         self._token = bytes.fromhex(token) if token else None
         self._key = bytes.fromhex(key) if key else None
-        self._buffer = b""
+        self._buffer = bytearray()
+        self._buf_pos = 0
+        # 复用的 socket 接收缓冲区
+        self._recv_buf = bytearray(512)
+        self._recv_mv = memoryview(self._recv_buf)
+        self._heartbeat_packet: bytearray | None = None
         self._device_name = name
         self._device_id = device_id
         self._device_type = device_type
@@ -68,7 +126,7 @@ class MiedaDevice(threading.Thread):
         self._sn8 = sn8
         self._manufacturer_code = manufacturer_code
         self._attributes = {
-            "device_type": "T0x%02X" % device_type,
+            "device_type": _TYPE_STR[device_type] if 0 <= device_type < 256 else "T0x%02X" % device_type,
             "sn": sn,
             "sn8": sn8,
             "subtype": subtype
@@ -77,45 +135,52 @@ class MiedaDevice(threading.Thread):
         self._heartbeat_interval = 10
         self._device_connected(connected)
         self._queries = [{}]
-        self._centralized = []
+        self._centralized = ()
         self._calculate_get = []
         self._calculate_set = []
         self._default_values = {}
-        self._lua_runtime = MideaCodec(lua_file, device_type=self._attributes.get("device_type"), sn=sn, subtype=subtype) if lua_file is not None else None
+        self._default_keys = frozenset()
+        # 点号属性名的拆分结果，在加载映射时预先计算
+        self._dotted_paths: dict[str, tuple[str, ...]] = {}
+        self._lua_runtime = None
+        self.set_lua_file(lua_file)
         self._cloud = cloud
-
-    def _handle_t0xd9_db_location_selection(self, status, value):
-        # 处理T0xD9复式洗衣机的db_location_selection更新
-        if value == "left":
-            status["db_location"] = 1
-            self._attributes["db_location"] = 1
-        elif value == "right":
-            status["db_location"] = 2
-            self._attributes["db_location"] = 2
-
-    def _adjust_t0xd9_db_location_based_on_position(self, status=None):
-        # 根据db_position调整T0xD9复式洗衣机的db_location
-        db_position = self._attributes.get("db_position", 1)
-        current_location = self._attributes.get("db_location", 1)
-        
-        if db_position == 1:
-            # db_position = 1，db_location 保持不变
-            calculated_location = current_location
-        elif db_position == 0:
-            # db_position = 0，db_location 切换为另一个选项
-            calculated_location = 2 if current_location == 1 else 1
-        
-        if status is not None:
-            status["db_location"] = calculated_location
-        
-        return calculated_location
-
-    def _sync_t0xd9_location_selection(self, location):
-        # 同步T0xD9复式洗衣机的db_location和db_location_selection
-        if location == 1:
-            self._attributes["db_location_selection"] = "left"
-        elif location == 2:
-            self._attributes["db_location_selection"] = "right"
+        # 按云端类型预先绑定设备控制与状态查询接口，调用时无需再判断类型
+        self._send_control = None
+        self._get_status = None
+        if isinstance(cloud, MSmartHomeCloud):
+            device_kwargs = {
+                "appliance_code": device_id,
+                "device_type": device_type,
+                "sn": sn,
+                "model_number": subtype,
+                "manufacturer_code": manufacturer_code,
+            }
+            self._send_control = partial(cloud.send_device_control, **device_kwargs)
+            self._get_status = partial(cloud.get_device_status, **device_kwargs)
+        elif isinstance(cloud, MeijuCloud):
+            self._send_control = partial(cloud.send_device_control, device_id)
+            self._get_status = partial(cloud.get_device_status, appliance_code=device_id)
+
+    def _apply_db_location_logic(self, status, selection=_MISSING, sync_selection=False):
+        # T0xD9复式洗衣机：显式选择筒位时按选择设置 db_location，否则根据 db_position 计算
+        if selection is not _MISSING:
+            location = self._LOC_FROM_SEL.get(selection)
+            if location is not None:
+                status["db_location"] = location
+                self._attributes["db_location"] = location
+            return location
+
+        # db_position = 1，db_location 保持不变；db_position = 0，db_location 切换为另一个选项
+        location = self._attributes.get("db_location", 1)
+        if self._attributes.get("db_position", 1) == 0:
+            location = self._LOC_FLIP.get(location, 1)
+        status["db_location"] = location
+
+        # 同步更新 db_location_selection
+        if sync_selection and (selection := self._LOC_SEL.get(location)) is not None:
+            self._attributes["db_location_selection"] = selection
+        return location
 
     def _adjust_control_status(self, running_status):
         # 依据运行状态调整设备的控制状态
@@ -178,32 +243,51 @@ class MiedaDevice(threading.Thread):
     def set_refresh_interval(self, refresh_interval):
         self._refresh_interval = refresh_interval
 
+    def set_lua_file(self, lua_file: str | None):
+        self._lua_runtime = MideaCodec(
+            lua_file,
+            device_type=self._attributes.get("device_type"),
+            sn=self._sn,
+            subtype=self._subtype
+        ) if lua_file is not None else None
+
     def set_queries(self, queries: list):
         self._queries = queries
 
     def set_centralized(self, centralized: list):
-        self._centralized = centralized
+        self._centralized = tuple(sys.intern(attr) for attr in centralized or ())
+        self._add_dotted_paths(self._centralized)
 
     def set_calculate(self, calculate: dict):
-        values_get = calculate.get("get")
-        values_set = calculate.get("set")
-        self._calculate_get = values_get if values_get else []
-        self._calculate_set = values_set if values_set else []
+        self._calculate_get = compile_calculations(calculate.get("get"))
+        self._calculate_set = compile_calculations(calculate.get("set"))
 
     def set_default_values(self, default_values: dict):
         """设置属性的默认值"""
         self._default_values = default_values or {}
+        self._default_keys = frozenset(self._default_values)
+        self._add_dotted_paths(self._default_keys)
+
+    def _add_dotted_paths(self, keys):
+        for key in keys:
+            if '.' in key and key not in self._dotted_paths:
+                self._dotted_paths[key] = tuple(key.split('.'))
 
     def get_attribute(self, attribute):
         return self._attributes.get(attribute)
 
     def _convert_to_nested_structure(self, attributes):
         """Convert dot-notation attributes to nested structure."""
+        # Common case: no dotted keys, the caller's dict is used as is
+        if not any('.' in key for key in attributes):
+            return attributes
         nested = {}
+        dotted_paths = self._dotted_paths
         for key, value in attributes.items():
             if '.' in key:
                 # Handle nested attributes with dot notation
-                keys = key.split('.')
+                if (keys := dotted_paths.get(key)) is None:
+                    keys = dotted_paths[key] = tuple(key.split('.'))
                 current_dict = nested
                 
                 # Navigate to the parent dictionary
@@ -220,19 +304,15 @@ class MiedaDevice(threading.Thread):
         return nested
 
     async def set_attribute(self, attribute, value):
-        if attribute in self._attributes.keys():
-            new_status = {}
-            for attr in self._centralized:
-                new_status[attr] = self._attributes.get(attr)
+        if attribute in self._attributes:
+            new_status = {attr: self._attributes.get(attr) for attr in self._centralized}
             new_status[attribute] = value
             
-            # 针对T0xD9复式洗衣机，当本地变更 db_location_selection 时，调整 db_location
+            # 针对T0xD9复式洗衣机，根据 db_location_selection 或 db_position 设置 db_location
             if self._device_type == 0xD9:
-                if attribute == "db_location_selection":
-                    self._handle_t0xd9_db_location_selection(new_status, value)
-                # 非 db_location_selection 更新，根据 db_position 设置 db_location
-                else:
-                    self._adjust_t0xd9_db_location_based_on_position(new_status)
+                self._apply_db_location_logic(
+                    new_status, value if attribute == "db_location_selection" else _MISSING
+                )
 
             # Convert dot-notation attributes to nested structure for transmission
             nested_status = self._convert_to_nested_structure(new_status)
@@ -242,84 +322,55 @@ class MiedaDevice(threading.Thread):
                     if set_cmd := self._lua_runtime.build_control(nested_status, status=self._attributes):
                         await self._build_send(set_cmd)
                         return
-                except Exception as e:
-                    MideaLogger.debug(f"LuaRuntimeError in set_attribute {nested_status}: {repr(e)}")
-                    traceback.print_exc()
-
-            cloud = self._cloud
-            if cloud and hasattr(cloud, "send_device_control"):
-                if isinstance(cloud, MSmartHomeCloud):
-                    await cloud.send_device_control(
-                        appliance_code=self._device_id,
-                        device_type=self.device_type,
-                        sn=self.sn,
-                        model_number=self.subtype,
-                        manufacturer_code=self._manufacturer_code,
-                        control=nested_status,
-                        status=self._attributes)
-                elif isinstance(cloud, MeijuCloud):
-                    await cloud.send_device_control(self._device_id, control=nested_status, status=self._attributes)
+                except Exception:
+                    MideaLogger.debug("LuaRuntimeError in set_attribute %s", nested_status, exc_info=True)
+
+            if self._send_control is not None:
+                await self._send_control(control=nested_status, status=self._attributes)
 
     async def set_attributes(self, attributes):
-        new_status = {}
-        for attr in self._centralized:
-            new_status[attr] = self._attributes.get(attr)
+        new_status = {attr: self._attributes.get(attr) for attr in self._centralized}
         has_new = False
         for attribute, value in attributes.items():
-            if attribute in self._attributes.keys():
+            if attribute in self._attributes:
                 has_new = True
                 new_status[attribute] = value
-    
-        # 针对T0xD9复式洗衣机，根据 db_location_selection 调整 db_location
+        # 没有可下发的已知属性，无需计算筒位或构造控制命令
+        if not has_new:
+            return
+
+        # 针对T0xD9复式洗衣机，根据 db_location_selection 或 db_position 设置 db_location
+        # 筒位完全在本地计算并随本次控制一起下发，不额外查询设备状态
         if self._device_type == 0xD9:
-            if "db_location_selection" in attributes:
-                location_selection = attributes["db_location_selection"]
-                self._handle_t0xd9_db_location_selection(new_status, location_selection)
-            else:
-                # 非 db_location_selection 更新，根据 db_position 设置 db_location
-                self._adjust_t0xd9_db_location_based_on_position(new_status)
+            self._apply_db_location_logic(new_status, attributes.get("db_location_selection", _MISSING))
 
         # Convert dot-notation attributes to nested structure for transmission
         nested_status = self._convert_to_nested_structure(new_status)
-        
-        if has_new:
-            if self._lua_runtime is not None:
-                try:
-                    if set_cmd := self._lua_runtime.build_control(nested_status, status=self._attributes):
-                        await self._build_send(set_cmd)
-                        return
-                except Exception as e:
-                    MideaLogger.debug(f"LuaRuntimeError in set_attributes {nested_status}: {repr(e)}")
-                    traceback.print_exc()
-
-            cloud = self._cloud
-            if cloud and hasattr(cloud, "send_device_control"):
-                if isinstance(cloud, MSmartHomeCloud):
-                    await cloud.send_device_control(
-                        appliance_code=self._device_id,
-                        device_type=self.device_type,
-                        sn=self.sn,
-                        model_number=self.subtype,
-                        manufacturer_code=self._manufacturer_code,
-                        control=nested_status,
-                        status=self._attributes)
-                elif isinstance(cloud, MeijuCloud):
-                    await cloud.send_device_control(self._device_id, control=nested_status, status=self._attributes)
+
+        if self._lua_runtime is not None:
+            try:
+                if set_cmd := self._lua_runtime.build_control(nested_status, status=self._attributes):
+                    await self._build_send(set_cmd)
+                    return
+            except Exception:
+                MideaLogger.debug("LuaRuntimeError in set_attributes %s", nested_status, exc_info=True)
+
+        if self._send_control is not None:
+            await self._send_control(control=nested_status, status=self._attributes)
 
     def set_ip_address(self, ip_address):
         MideaLogger.debug(f"Update IP address to {ip_address}")
         self._ip_address = ip_address
         self.close_socket()
 
-    def send_command(self, cmd_type, cmd_body: bytearray):
-        cmd = MessageQuestCustom(self._device_type, cmd_type, cmd_body)
+    async def send_command(self, cmd_type, cmd_body: bytearray):
         try:
-            self._build_send(cmd.serialize().hex())
+            await self._build_send(_serialize_custom(self._device_type, cmd_type, bytes(cmd_body)))
         except socket.error as e:
             MideaLogger.debug(
                 f"Interface send_command failure, {repr(e)}, "
                 f"cmd_type: {cmd_type}, cmd_body: {cmd_body.hex()}",
-                self._device_id
+                device_id=self._device_id
             )
 
     def register_update(self, update):
@@ -327,43 +378,46 @@ class MiedaDevice(threading.Thread):
 
     @staticmethod
     def _fetch_v2_message(msg):
+        # 以偏移量遍历缓冲区，只复制完整的报文和最后剩余的部分
+        mv = memoryview(msg)
+        total = len(mv)
+        offset = 0
         result = []
-        while len(msg) > 0:
-            factual_msg_len = len(msg)
-            if factual_msg_len < 6:
-                break
-            alleged_msg_len = msg[4] + (msg[5] << 8)
-            if factual_msg_len >= alleged_msg_len:
-                result.append(msg[:alleged_msg_len])
-                msg = msg[alleged_msg_len:]
-            else:
+        while total - offset >= 6:
+            alleged_msg_len = mv[offset + 4] | (mv[offset + 5] << 8)
+            if alleged_msg_len == 0 or total - offset < alleged_msg_len:
                 break
-        return result, msg
+            result.append(bytes(mv[offset:offset + alleged_msg_len]))
+            offset += alleged_msg_len
+        return result, bytes(mv[offset:])
 
     def _authenticate(self):
         request = self._security.encode_8370(
             self._token, MSGTYPE_HANDSHAKE_REQUEST)
         MideaLogger.debug(f"Handshaking")
         self._socket.send(request)
-        response = self._socket.recv(512)
-        if len(response) < 20:
+        received = self._socket.recv_into(self._recv_buf, 512)
+        if received < 20:
             raise AuthException()
-        response = response[8: 72]
+        response = bytes(self._recv_mv[8:min(received, 72)])
         self._security.tcp_key(response, self._key)
 
     def _send_message_v2(self, data):
         if self._socket is not None:
             self._socket.send(data)
         else:
-            MideaLogger.debug(f"Command send failure, device disconnected, data: {data.hex()}")
+            if MideaLogger.debug_enabled():
+                MideaLogger.debug("Command send failure, device disconnected, data: %s", data.hex())
 
     def _send_message_v3(self, data, msg_type=MSGTYPE_ENCRYPTED_REQUEST):
         data = self._security.encode_8370(data, msg_type)
         self._send_message_v2(data)
 
-    async def _build_send(self, cmd: str):
-        MideaLogger.debug(f"Sending: {cmd.lower()}")
-        bytes_cmd = bytes.fromhex(cmd)
+    async def _build_send(self, cmd: str | bytes):
+        # Lua 编码结果为十六进制字符串，自行组包的命令直接传入 bytes
+        bytes_cmd = bytes.fromhex(cmd) if isinstance(cmd, str) else cmd
+        if MideaLogger.debug_enabled():
+            MideaLogger.debug("Sending: %s", bytes_cmd.hex())
         await self._send_message(bytes_cmd)
 
     async def refresh_status(self):
@@ -371,176 +425,138 @@ class MiedaDevice(threading.Thread):
             # 针对T0xD9复式洗衣机，根据 db_position 动态调整 db_location
             actual_query = query.copy() if isinstance(query, dict) else query
             if self._device_type == 0xD9 and isinstance(actual_query, dict):
-                # 根据 db_position 调整 db_location
-                calculated_location = self._adjust_t0xd9_db_location_based_on_position(actual_query)
-
-                # 同步更新db_location_selection
-                self._sync_t0xd9_location_selection(calculated_location)
-
-            cloud = self._cloud
-            if cloud and hasattr(cloud, "get_device_status"):
-                if isinstance(cloud, MSmartHomeCloud):
-                    if status := await cloud.get_device_status(
-                        appliance_code=self._device_id,
-                        device_type=self.device_type,
-                        sn=self.sn,
-                        model_number=self.subtype,
-                        manufacturer_code=self._manufacturer_code,
-                        query=actual_query
-                    ):
-                        self._parse_cloud_message(status)
-                    else:
-                        if self._lua_runtime is not None:
-                            if query_cmd := self._lua_runtime.build_query(actual_query):
-                                await self._build_send(query_cmd)
-
-                elif isinstance(cloud, MeijuCloud):
-                    if status := await cloud.get_device_status(
-                        appliance_code=self._device_id,
-                        query=actual_query
-                    ):
-                        self._parse_cloud_message(status)
-                    else:
-                        if self._lua_runtime is not None:
-                            if query_cmd := self._lua_runtime.build_query(actual_query):
-                                await self._build_send(query_cmd)
+                self._apply_db_location_logic(actual_query, sync_selection=True)
+
+            if self._get_status is not None:
+                if status := await self._get_status(query=actual_query):
+                    self._parse_cloud_message(status)
+                elif self._lua_runtime is not None:
+                    if query_cmd := self._lua_runtime.build_query(actual_query):
+                        await self._build_send(query_cmd)
 
 
-    def _parse_cloud_message(self, status, update=True):
+    def _parse_cloud_message(self, status: dict, update: bool = True) -> ParseMessageResult:
         # MideaLogger.debug(f"Received: {decrypted}")
+        attributes = self._attributes
+        device_type = self._device_type
         new_status = {}
         # 对于有默认值的变量，在解析前先设置一次默认值
-        for attr, default_value in self._default_values.items():
-            # self._attributes[attr] = default_value
-            if attr not in self._attributes or self._attributes[attr] is None:
-                new_status[attr] = default_value
+        if default_keys := self._default_keys:
+            default_values = self._default_values
+            # 尚不存在的属性用集合差一次求出，已存在的只需检查是否为 None
+            for attr in default_keys - attributes.keys():
+                new_status[attr] = default_values[attr]
+            for attr in default_keys & attributes.keys():
+                if attributes[attr] is None:
+                    new_status[attr] = default_values[attr]
 
         # 处理云端返回的状态，云端结果会覆盖默认值
-        for single in status.keys():
-            value = status.get(single)
-            if single not in self._attributes or self._attributes[single] != value:
-                # self._attributes[single] = value
+        for single, value in status.items():
+            if attributes.get(single, _MISSING) != value:
                 new_status[single] = value
 
+        # 状态无变化，无需计算和通知
+        if not new_status:
+            return ParseMessageResult.SUCCESS
+
         # 对于T0xD9复式洗衣机，依据云端 db_running_status，调整本地 db_control_status
-        if self._device_type == 0xD9 and "db_running_status" in new_status:
+        if device_type == 0xD9 and "db_running_status" in new_status:
             running_status = new_status["db_running_status"]
             self._adjust_control_status(running_status)
 
         # 对于T0xDA、T0xDB、T0xDC设备，依据云端 running_status，调整本地 control_status
-        if self._device_type in [0xDA, 0xDB, 0xDC] and "running_status" in new_status:
+        if device_type in (0xDA, 0xDB, 0xDC) and "running_status" in new_status:
             running_status = new_status["running_status"]
             self._adjust_control_status(running_status)
 
-        if len(new_status) > 0:
-            # 确保所有状态都更新后再进行计算
-            for key, value in new_status.items():
-                self._attributes[key] = value
-
-            for c in self._calculate_get:
-                lvalue = c.get("lvalue")
-                rvalue = c.get("rvalue")
-                if lvalue and rvalue:
-                    calculate = False
-                    for s, v in new_status.items():
-                        if rvalue.find(f"[{s}]") >= 0:
-                            calculate = True
-                            break
-                    if calculate:
-                        calculate_str1 = \
-                            (f"{lvalue.replace('[', 'self._attributes[').replace("]", "\"]")} = "
-                             f"{rvalue.replace('[', 'self._attributes[').replace(']', "\"]")}") \
-                                .replace("[", "[\"")
-                        calculate_str2 = \
-                            (f"{lvalue.replace('[', 'new_status[').replace("]", "\"]")} = "
-                             f"{rvalue.replace('[', 'new_status[').replace(']', "\"]")}") \
-                                .replace("[", "[\"")
-                        try:
-                            exec(calculate_str1)
-                        except Exception as e:
-                            traceback.print_exc()
-                            MideaLogger.warning(
-                                f"Calculation Error: {lvalue} = {rvalue}, calculate_str1: {calculate_str1}",
-                                self._device_id
-                            )
-                        try:
-                            exec(calculate_str2)
-                        except Exception as e:
-                            traceback.print_exc()
-                            MideaLogger.warning(
-                                f"Calculation Error: {lvalue} = {rvalue}, calculate_str2: {calculate_str2}",
-                                self._device_id
-                            )
-            if update:
-                self._update_all(new_status)
+        # 确保所有状态都更新后再进行计算
+        attributes.update(new_status)
+        self._apply_calculations(new_status)
+        if update:
+            self._update_all(new_status)
         return ParseMessageResult.SUCCESS
 
-    def _parse_message(self, msg, update=True):
-        if self._protocol == 3:
-            messages, self._buffer = self._security.decode_8370(self._buffer + msg)
-        else:
-            messages, self._buffer = self.fetch_v2_message(self._buffer + msg)
+    def _apply_calculations(self, new_status: dict):
+        # 依据本次变化的属性执行计算规则，结果同时写入设备属性和本次变化中
+        attributes = self._attributes
+        for lvalue, rvalue, refs, calc in self._calculate_get:
+            if refs.isdisjoint(new_status):
+                continue
+            try:
+                calc(attributes, attributes)
+                calc(new_status, attributes)
+            except Exception as e:
+                MideaLogger.warning(
+                    f"Calculation Error: {lvalue} = {rvalue}, {repr(e)}", device_id=self._device_id
+                )
+
+    def _consume_buffer(self, msg):
+        # 追加到接收缓冲区，从读指针处拆包，已消费部分累计到阈值后再一次性释放
+        self._buffer.extend(msg)
+        try:
+            with memoryview(self._buffer) as view:
+                pending = view[self._buf_pos:]
+                try:
+                    if self._protocol == 3:
+                        messages, leftover = self._security.decode_8370(bytes(pending))
+                    else:
+                        messages, leftover = self._fetch_v2_message(pending)
+                    self._buf_pos += len(pending) - len(leftover)
+                finally:
+                    pending.release()
+        except Exception:
+            # 解包失败时丢弃整个缓冲区，避免坏数据残留影响后续报文
+            self._buffer.clear()
+            self._buf_pos = 0
+            raise
+        if self._buf_pos == len(self._buffer):
+            self._buffer.clear()
+            self._buf_pos = 0
+        elif self._buf_pos > self._BUFFER_RELAX:
+            del self._buffer[:self._buf_pos]
+            self._buf_pos = 0
+        return messages
+
+    def _parse_message(self, msg, update: bool = True) -> ParseMessageResult:
+        messages = self._consume_buffer(msg)
         if len(messages) == 0:
             return ParseMessageResult.PADDING
+        attributes = self._attributes
+        security = self._security
+        lua_runtime = self._lua_runtime
         for message in messages:
             if message == b"ERROR":
                 return ParseMessageResult.ERROR
             payload_len = message[4] + (message[5] << 8) - 56
             payload_type = message[2] + (message[3] << 8)
-            if payload_type in [0x1001, 0x0001]:
+            if payload_type in (0x1001, 0x0001):
                 # Heartbeat detected
                 pass
             elif len(message) > 56:
                 cryptographic = message[40:-16]
                 if payload_len % 16 == 0:
-                    decrypted = self._security.aes_decrypt(cryptographic)
-                    MideaLogger.debug(f"Received: {decrypted.hex().lower()}")
-                    if status := self._lua_runtime.decode_status(decrypted.hex()):
-                        MideaLogger.debug(f"Decoded: {status}")
+                    decrypted = security.aes_decrypt(cryptographic)
+                    decrypted_hex = decrypted.hex()
+                    MideaLogger.debug("Received: %s", decrypted_hex)
+                    if status := lua_runtime.decode_status(decrypted_hex):
+                        MideaLogger.debug("Decoded: %s", status)
                         new_status = {}
-                        for single in status.keys():
-                            value = status.get(single)
-                            if single not in self._attributes or self._attributes[single] != value:
-                                self._attributes[single] = value
+                        for single, value in status.items():
+                            if attributes.get(single, _MISSING) != value:
+                                attributes[single] = value
                                 new_status[single] = value
-                        if len(new_status) > 0:
-                            # 确保所有状态都更新后再进行计算
-                            for key, value in new_status.items():
-                                self._attributes[key] = value
-
-                            for c in self._calculate_get:
-                                lvalue = c.get("lvalue")
-                                rvalue = c.get("rvalue")
-                                if lvalue and rvalue:
-                                    calculate = False
-                                    for s, v in new_status.items():
-                                        if rvalue.find(f"[{s}]") >= 0:
-                                            calculate = True
-                                            break
-                                    if calculate:
-                                        calculate_str1 = \
-                                            (f"{lvalue.replace('[', 'self._attributes[')} = "
-                                             f"{rvalue.replace('[', 'self._attributes[')}") \
-                                                .replace("[", "[\"").replace("]", "\"]")
-                                        calculate_str2 = \
-                                            (f"{lvalue.replace('[', 'new_status[')} = "
-                                             f"{rvalue.replace('[', 'self._attributes[')}") \
-                                                .replace("[", "[\"").replace("]", "\"]")
-                                        try:
-                                            exec(calculate_str1)
-                                            exec(calculate_str2)
-                                        except Exception:
-                                            MideaLogger.warning(
-                                                f"Calculation Error: {lvalue} = {rvalue}", self._device_id
-                                            )
-                            if update:
-                                self._update_all(new_status)
+                        # 状态无变化，无需计算和通知
+                        if not new_status:
+                            continue
+                        self._apply_calculations(new_status)
+                        if update:
+                            self._update_all(new_status)
         return ParseMessageResult.SUCCESS
 
     async def _send_message(self, data):
         if reply := await self._cloud.send_cloud(self._device_id, data):
             if reply_dec := self._lua_runtime.decode_status(dec_string_to_bytes(reply).hex()):
-                MideaLogger.debug(f"Decoded: {reply_dec}")
+                MideaLogger.debug("Decoded: %s", reply_dec)
                 result = self._parse_cloud_message(reply_dec, update=False)
                 if result == ParseMessageResult.ERROR:
                     MideaLogger.debug(f"Message 'ERROR' received")
@@ -553,20 +569,27 @@ class MiedaDevice(threading.Thread):
     #     self._send_message_v2(data)
 
     async def _send_heartbeat(self):
-        msg = PacketBuilder(self._device_id, bytearray([0x00])).finalize(msg_type=0)
-        await self._send_message(msg)
+        # 心跳包除时间戳外固定不变，缓存不含校验的包体，每次只刷新时间戳并重新计算校验
+        if self._heartbeat_packet is None:
+            self._heartbeat_packet = PacketBuilder(self._device_id, bytearray([0x00])).finalize(msg_type=0)[:-16]
+        packet = self._heartbeat_packet
+        packet[12:20] = PacketBuilder.packet_time()
+        await self._send_message(packet + self._security.encode32_data(packet))
 
     def _device_connected(self, connected=True):
         self._connected = connected
         status = {"connected": connected}
         if not connected:
-            MideaLogger.warning(f"Device {self._device_id} disconnected", self._device_id)
+            MideaLogger.warning(f"Device {self._device_id} disconnected", device_id=self._device_id)
         else:
-            MideaLogger.debug(f"Device {self._device_id} connected", self._device_id)
+            MideaLogger.debug(f"Device {self._device_id} connected", device_id=self._device_id)
         self._update_all(status)
 
     def _update_all(self, status):
-        MideaLogger.debug(f"Status update: {status}")
+        # 没有订阅者或没有变化时无需通知
+        if not status or not self._updates:
+            return
+        MideaLogger.debug("Status update: %s", status)
         for update in self._updates:
             update(status)
 
@@ -603,11 +626,10 @@ class MiedaDevice(threading.Thread):
     #                 if now - previous_heartbeat >= self._heartbeat_interval:
     #                     self._send_heartbeat()
     #                     previous_heartbeat = now
-    #                 msg = self._socket.recv(512)
-    #                 msg_len = len(msg)
+    #                 msg_len = self._socket.recv_into(self._recv_buf)
     #                 if msg_len == 0:
     #                     raise socket.error("Connection closed by peer")
-    #                 result = self._parse_message(msg)
+    #                 result = self._parse_message(self._recv_mv[:msg_len])
     #                 if result == ParseMessageResult.ERROR:
     #                     MideaLogger.debug(f"Message 'ERROR' received")
     #                     self.disconnect()
@@ -1,5 +1,5 @@
-import inspect
 import logging
+import sys
 from enum import IntEnum
 
 
@@ -10,34 +10,44 @@ class MideaLogType(IntEnum):
     INFO = 4
 
 
+_LOG_LEVELS = {
+    MideaLogType.DEBUG: logging.DEBUG,
+    MideaLogType.INFO: logging.INFO,
+    MideaLogType.WARN: logging.WARNING,
+    MideaLogType.ERROR: logging.ERROR,
+}
+
+
 class MideaLogger:
     @staticmethod
-    def _log(log_type, log, device_id):
-        frm = inspect.stack()[2]
-        mod = inspect.getmodule(frm[0])
+    def _log(log_type, log, args, device_id, exc_info=False):
+        # 仅取调用方所在模块名，并在级别未启用时跳过格式化
+        logger = logging.getLogger(sys._getframe(2).f_globals.get("__name__"))
+        level = _LOG_LEVELS[log_type]
+        if not logger.isEnabledFor(level):
+            return
         if device_id is not None:
             log = f"[{device_id}] {log}"
-        if log_type == MideaLogType.DEBUG:
-            logging.getLogger(mod.__name__).debug(log)
-        elif log_type == MideaLogType.INFO:
-            logging.getLogger(mod.__name__).info(log)
-        elif log_type == MideaLogType.WARN:
-            logging.getLogger(mod.__name__).warning(log)
-        elif log_type == MideaLogType.ERROR:
-            logging.getLogger(mod.__name__).error(log)
+        # exc_info 的堆栈格式化同样只在级别启用时发生
+        logger.log(level, log, *args, exc_info=exc_info, stacklevel=3)
+
+    @staticmethod
+    def debug_enabled():
+        # 供调用方在构造开销较大的调试信息前判断
+        return logging.getLogger(sys._getframe(1).f_globals.get("__name__")).isEnabledFor(logging.DEBUG)
 
     @staticmethod
-    def debug(log, device_id=None):
-        MideaLogger._log(MideaLogType.DEBUG, log, device_id)
+    def debug(log, *args, device_id=None, exc_info=False):
+        MideaLogger._log(MideaLogType.DEBUG, log, args, device_id, exc_info)
 
     @staticmethod
-    def info(log, device_id=None):
-        MideaLogger._log(MideaLogType.INFO, log, device_id)
+    def info(log, *args, device_id=None, exc_info=False):
+        MideaLogger._log(MideaLogType.INFO, log, args, device_id, exc_info)
 
     @staticmethod
-    def warning(log, device_id=None):
-        MideaLogger._log(MideaLogType.WARN, log, device_id)
+    def warning(log, *args, device_id=None, exc_info=False):
+        MideaLogger._log(MideaLogType.WARN, log, args, device_id, exc_info)
 
     @staticmethod
-    def error(log, device_id=None):
-        MideaLogger._log(MideaLogType.ERROR, log, device_id)
\ No newline at end of file
+    def error(log, *args, device_id=None, exc_info=False):
+        MideaLogger._log(MideaLogType.ERROR, log, args, device_id, exc_info)
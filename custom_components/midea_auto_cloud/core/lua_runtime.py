@@ -99,10 +99,10 @@ class MideaCodec(LuaRuntime):
 
             query_dict["control"]["type"] = prefix
         json_str = json.dumps(query_dict)
-        MideaLogger.debug(f"LuaRuntime json_str {json_str}")
+        MideaLogger.debug("LuaRuntime json_str %s", json_str)
         try:
             result = self.json_to_data(json_str)
-            MideaLogger.debug(f"LuaRuntime Result {result}")
+            MideaLogger.debug("LuaRuntime Result %s", result)
             return result
         except lupa.LuaError as e:
             traceback.print_exc()
@@ -1,7 +1,6 @@
 """Data coordinator for Midea Auto Cloud integration."""
 
 import logging
-import traceback
 from datetime import datetime, timedelta
 from typing import NamedTuple
 
@@ -194,28 +193,15 @@ class MideaDataUpdateCoordinator(DataUpdateCoordinator[MideaDeviceData]):
         """Set multiple device attributes."""
         # 云端控制：构造 control 与 status（携带当前状态作为上下文）
         # 计算逻辑使用所有属性（包括有默认值的变量）
-        for c in self.device._calculate_set:
-            lvalue = c.get("lvalue")
-            rvalue = c.get("rvalue")
-            if lvalue and rvalue:
-                calculate = False
-                for s, v in attributes.items():
-                    if rvalue.find(f"[{s}]") >= 0:
-                        calculate = True
-                        break
-                if calculate:
-                    calculate_str1 = \
-                        (f"{lvalue.replace('[', 'attributes[').replace("]", "\"]")} = "
-                         f"{rvalue.replace('[', 'attributes[').replace(']', "\"]")}") \
-                            .replace("[", "[\"")
-                    try:
-                        exec(calculate_str1)
-                    except Exception as e:
-                        traceback.print_exc()
-                        MideaLogger.warning(
-                            f"Calculation Error: {lvalue} = {rvalue}, calculate_str1: {calculate_str1}",
-                            self._device_id
-                        )
+        for lvalue, rvalue, refs, calc in self.device._calculate_set:
+            if not refs.isdisjoint(attributes):
+                try:
+                    calc(attributes, attributes)
+                except Exception as e:
+                    MideaLogger.warning(
+                        f"Calculation Error: {lvalue} = {rvalue}, {repr(e)}",
+                        device_id=self._device_id
+                    )
         
         # 冻结有默认值的变量：从发送到云端的 attributes 中移除
         attributes_to_send = {}
@@ -236,7 +222,7 @@ class MideaDataUpdateCoordinator(DataUpdateCoordinator[MideaDeviceData]):
         """Send a command to the device."""
         try:
             cmd_body_bytes = bytearray.fromhex(cmd_body)
-            self.device.send_command(cmd_type, cmd_body_bytes)
+            await self.device.send_command(cmd_type, cmd_body_bytes)
         except ValueError as e:
             _LOGGER.error(f"Invalid command body: {e}")
             raise